@@ -1,12 +1,12 @@
 import os
 import sys
+import math
 import time
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from collections import deque
-from PIL import Image, ImageTk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from collections import OrderedDict, deque
 import numpy as np
 
 # -------------- CONFIG ----------------
@@ -28,19 +28,25 @@ OUTLET_STREAM = "Outlet"
 
 MAX_POINTS    = 1200           # keep at most this many samples in memory
 UPDATE_MS     = 500            # default refresh interval
+BG_CACHE_SIZE = 4              # background sizes kept as ready PhotoImages
+SAMPLE_EPS    = 1e-6           # pressure change below this counts as unchanged
+XLIM_STEP_S   = 10.0           # the 60 s window scrolls in 1/6 steps (~20 samples)
+YLIM_DEADBAND = 0.01           # relative overshoot tolerated before rescaling y
 # --------------------------------------
 
 try:
+    import pythoncom
     import win32com.client
 except ImportError:
-    win32com = None
+    pythoncom = win32com = None
     print("pywin32 not installed – running in demo mode.")
 
 # ───────────────── UniSim connector ─────────────────
 class UniSimConnector:
-    def __init__(self):
+    def __init__(self, connect=True):
         self.connected = False
-        if win32com is None:
+        self._poller = None
+        if win32com is None or not connect:
             return
 
         try:
@@ -50,23 +56,15 @@ class UniSimConnector:
             print("Opening:", SIM_PATH)
             self.sim = self.app.SimulationCases.Open(SIM_PATH)
             self.sim.Visible = 1                # requested
+            # Fail here rather than in the poller if the case lacks the streams
             fs = self.sim.Flowsheet
-            self.inlet  = fs.MaterialStreams.Item(INLET_STREAM)
-            self.outlet = fs.MaterialStreams.Item(OUTLET_STREAM)
+            fs.MaterialStreams.Item(INLET_STREAM)
+            fs.MaterialStreams.Item(OUTLET_STREAM)
             self.connected = True
             print("UniSim connected.")
         except Exception as e:
             print("UniSim connection failed:", e)
 
-    def inlet_pressure(self):
-        return float(self.inlet.PressureValue)
-
-    def outlet_pressure(self):
-        return float(self.outlet.PressureValue)
-
-    def sim_time(self):
-        return float(self.sim.Solver.Integrator.GetTime())
-
     def start(self):
         if self.connected:
             self.sim.Solver.Integrator.IsRunning = 1
@@ -75,9 +73,126 @@ class UniSimConnector:
         if self.connected:
             self.sim.Solver.Integrator.IsRunning = 0
 
+    def detach(self):
+        """Hand the connection over to another thread.
+
+        Returns marshalling streams for :meth:`attach` and drops the calling
+        thread's proxies, which must not be used from any other apartment.
+        """
+        streams = (_marshal(self.app), _marshal(self.sim))
+        self.app = self.sim = None
+        return streams
+
+    def attach(self, streams):
+        """Re-create the COM proxies in the calling thread from :meth:`detach`."""
+        app_stream, sim_stream = streams
+        self.app = _unmarshal(app_stream)
+        self.sim = _unmarshal(sim_stream)
+
+    def start_polling(self, interval_ms, q):
+        """Poll (sim time, inlet pressure, outlet pressure) on a daemon thread.
+
+        Only the newest sample is kept in *q*; a failed read is put there as
+        the exception and ends the thread. :meth:`stop_polling` ends it too.
+        """
+        # COM objects belong to the thread that created them; the worker gets
+        # its own proxy to the case through a marshalling stream.
+        stream = _marshal(self.sim)
+        stop = threading.Event()
+        thread = threading.Thread(target=self._poll, daemon=True,
+                                  args=(stream, interval_ms, q, stop))
+        thread.start()
+        self._poller = (thread, stop)
+
+    def stop_polling(self, timeout=2.0):
+        """Stop the poller and wait for it to release its proxies."""
+        if self._poller is None:
+            return
+        thread, stop = self._poller
+        self._poller = None
+        stop.set()
+        # A daemon thread still running at exit would be killed mid-CoUninitialize
+        thread.join(timeout)
+
+    @staticmethod
+    def _poll(stream, interval_ms, q, stop):
+        pythoncom.CoInitialize()
+        try:
+            UniSimConnector._poll_loop(stream, interval_ms, q, stop)
+        except Exception as e:
+            # Without its traceback the error no longer pins _poll_loop's frame,
+            # so its proxies are released here rather than from the Tk thread
+            e.__context__ = None
+            _put_latest(q, e.with_traceback(None))
+        finally:
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _poll_loop(stream, interval_ms, q, stop):
+        # All proxies are locals here, so they are released when this returns,
+        # before the apartment is torn down
+        sim = _unmarshal(stream)
+        integrator = sim.Solver.Integrator
+        streams = sim.Flowsheet.MaterialStreams
+        inlet  = streams.Item(INLET_STREAM)
+        outlet = streams.Item(OUTLET_STREAM)
+        while True:
+            sample = (float(integrator.GetTime()),
+                      float(inlet.PressureValue),
+                      float(outlet.PressureValue))
+            _put_latest(q, sample)
+            if stop.wait(interval_ms / 1000):
+                break
+
+
+def _marshal(obj):
+    return pythoncom.CoMarshalInterThreadInterfaceInStream(
+        pythoncom.IID_IDispatch, obj._oleobj_)
+
+def _unmarshal(stream):
+    return win32com.client.Dispatch(pythoncom.CoGetInterfaceAndReleaseStream(
+        stream, pythoncom.IID_IDispatch))
+
+def _put_latest(q, item):
+    # Replace a sample the GUI has not picked up yet rather than dropping the new one.
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
 # ───────────────── Live-plot window ─────────────────
+# Plot styling goes into rcParams so new figures need no per-instance set_* calls
+_PLOT_RC = {
+    "figure.facecolor": "#FFF",
+    "axes.facecolor":   "#FAFAFA",
+    "lines.linewidth":  2,
+    "lines.antialiased": False,
+}
+
+# Figures of closed plot windows, keyed by title, reused when reopened
+_FIG_POOL = {}
+_FIG_DPI = 100
+
+# Per-tick callbacks of the open plot windows, all driven by MainApp's poll loop
+_TICK_SUBSCRIBERS = []
+
+# matplotlib.transforms.Bbox, bound when the first plot window imports matplotlib
+Bbox = None
+
+def _tick():
+    for update in list(_TICK_SUBSCRIBERS):
+        update()
+
 class LivePlot(tk.Toplevel):
     def __init__(self, title, y_getter, t_getter):
+        global Bbox
+        # matplotlib is imported on first use to keep it off the start-up path
+        import matplotlib
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from matplotlib.transforms import Bbox
+
         super().__init__()
         self.title(title)
         self.geometry("900x520")
@@ -86,56 +201,107 @@ class LivePlot(tk.Toplevel):
         self.y_get = y_getter
         self.t_get = t_getter
         self.interval = tk.IntVar(value=UPDATE_MS)
-        self.x = deque(maxlen=MAX_POINTS)
-        self.y = deque(maxlen=MAX_POINTS)
-
-        fig = Figure(figsize=(5, 4), dpi=100, facecolor="#FFF")
-        self.ax = fig.add_subplot(111, facecolor="#FAFAFA")
-        self.ax.set_title(title)
-        self.ax.set_xlabel("Simulation Time (s)")
-        self.ax.set_ylabel("Pressure")
-
-        self.line, = self.ax.plot([], [], color="#007ACC", lw=2, antialiased=False)
+        # Ring buffers (oldest sample at _head once full) and the contiguous
+        # copies handed to the line, so steady-state ticks allocate nothing.
+        self._xbuf = np.empty(MAX_POINTS, dtype=np.float64)
+        self._ybuf = np.empty_like(self._xbuf)
+        self._xdisp = np.empty_like(self._xbuf)
+        self._ydisp = np.empty_like(self._xbuf)
+        self._head = 0
+        self._count = 0
+        # Monotonic deques of (seq, y) pairs: the front of each is the min/max
+        # of the samples still in the ring buffer.
+        self._seq = 0
+        self._min_dq = deque()
+        self._max_dq = deque()
+        self._extremes = None
+
+        self._pool_key = title
+        fig = _FIG_POOL.pop(title, None)
+        if fig is None:
+            matplotlib.rcParams.update(_PLOT_RC)
+            fig = Figure(figsize=(5, 4), dpi=_FIG_DPI)
+            self.ax = fig.add_subplot(111)
+            self.ax.set_title(title)
+            self.ax.set_xlabel("Simulation Time (s)")
+            self.ax.set_ylabel("Pressure")
+            self.line, = self.ax.plot([], [], color="#007ACC", animated=True)
+        else:
+            self.ax = fig.axes[0]
+            self.line = self.ax.lines[0]
+            self.line.set_data([], [])
         self.canvas = FigureCanvasTkAgg(fig, master=self)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Interval slider
+        # Blitting: every full draw (first show, resize, new axis limits) refreshes
+        # the cached background; regular ticks only repaint the line on top of it.
+        self._bg = None
+        self._line_extent = None
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.draw()
+
+        # Interval slider (redraws follow the shared tick, so it moves in UPDATE_MS steps)
         ctrl = ttk.Frame(self, padding=8)
         ctrl.pack(fill="x")
         ttk.Label(ctrl, text="Refresh (ms)").pack(side="left", padx=(0, 5))
-        ttk.Scale(ctrl, from_=200, to=3000, variable=self.interval,
+        ttk.Scale(ctrl, from_=UPDATE_MS, to=6 * UPDATE_MS, variable=self.interval,
+                  command=self._snap_interval,
                   orient="horizontal", length=240).pack(side="left")
 
-        # Start loop
-        self._after_id = None
+        self._drawing = False
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.current_ymin = None
         self.current_ymax = None
-        self._update()
-
-    def _update(self):
-        try:
-            t_val = self.t_get()
-            y_val = self.y_get()
-        except Exception as e:
-            messagebox.showerror("Data error", str(e))
+        self._last_xmin = None
+        self._last_t, self._last_y = None, None
+        self._dirty = False
+        self._ticks_since_draw = 0
+        # Join the shared tick
+        _TICK_SUBSCRIBERS.append(self._update_body)
+
+    def _on_sample(self):
+        t_val = self.t_get()
+        y_val = self.y_get()
+        # Integrator stopped / nothing new: keep the current frame
+        if t_val == self._last_t and abs(y_val - self._last_y) < SAMPLE_EPS:
             return
+        self._last_t, self._last_y = t_val, y_val
+
+        self._append(t_val, y_val)
+        self._dirty = True
 
-        self.x.append(t_val)
-        self.y.append(y_val)
+    def _snap_interval(self, value):
+        self.interval.set(max(1, round(float(value) / UPDATE_MS)) * UPDATE_MS)
 
-        x_data = np.array(self.x, dtype=np.float32)
-        y_data = np.array(self.y, dtype=np.float32)
+    def _update_body(self):
+        self._on_sample()
+        self._ticks_since_draw += 1
+        # Nothing new to show, or a slow draw must not let a second tick stack up
+        if self._drawing or not self._dirty:
+            return
+        # The slider sets how many ticks this window waits between redraws
+        if self._ticks_since_draw < max(1, round(self.interval.get() / UPDATE_MS)):
+            return
 
-        # Update x-axis limits
+        self._ticks_since_draw = 0
+        self._dirty = False
+        x_data, y_data = self._ordered()
+
+        # Update x-axis limits, snapped up to whole steps so the newest sample
+        # stays in view while the window only moves once per step
+        limits_changed = False
         if len(x_data) > 0:
-            xmin = max(0, x_data[-1] - 60)
-            self.ax.set_xlim(xmin, xmin + 60)
+            xmin = max(0.0, math.ceil((x_data[-1] - 60) / XLIM_STEP_S) * XLIM_STEP_S)
+            if xmin != self._last_xmin:
+                self._last_xmin = xmin
+                self.ax.set_xlim(xmin, xmin + 60)
+                limits_changed = True
 
         # Update y-axis limits conditionally
-        if len(y_data) > 0:
-            new_ymin = np.min(y_data)
-            new_ymax = np.max(y_data)
+        extremes = (self._min_dq[0][1], self._max_dq[0][1])
+        if extremes != self._extremes:
+            self._extremes = extremes
+            new_ymin, new_ymax = extremes
             if new_ymin == new_ymax:
                 new_ymin -= 1e-6
                 new_ymax += 1e-6
@@ -144,25 +310,111 @@ class LivePlot(tk.Toplevel):
             if self.current_ymin is None or self.current_ymax is None:
                 update_ylim = True
             else:
-                if new_ymin < self.current_ymin * 0.99 or new_ymax > self.current_ymax * 1.01:
+                band = YLIM_DEADBAND * max(abs(self.current_ymin), abs(self.current_ymax))
+                if new_ymin < self.current_ymin - band or new_ymax > self.current_ymax + band:
                     update_ylim = True
 
             if update_ylim:
-                self.ax.set_ylim(new_ymin * 0.98, new_ymax * 1.02)
+                ylim = (new_ymin * 0.98, new_ymax * 1.02)
+                if self.ax.get_ylim() != ylim:
+                    self.ax.set_ylim(*ylim)
+                    limits_changed = True
                 self.current_ymin, self.current_ymax = self.ax.get_ylim()
 
         # Update plot data
-        self.line.set_data(x_data, y_data)
-        self.canvas.draw_idle()
-
-        self._after_id = self.after(self.interval.get(), self._update)
+        self.line.set_data(*self._clip_to_view(x_data, y_data))
+        self._drawing = True
+        try:
+            if limits_changed or self._bg is None:
+                self.canvas.draw()
+            else:
+                self._blit_line()
+            # Flush pending idle redraws only; update() would re-enter the event loop.
+            self.update_idletasks()
+        finally:
+            self._drawing = False
+
+    def _append(self, t_val, y_val):
+        self._xbuf[self._head] = t_val
+        self._ybuf[self._head] = y_val
+        self._head = (self._head + 1) % MAX_POINTS
+        self._count = min(self._count + 1, MAX_POINTS)
+
+        seq = self._seq
+        self._seq += 1
+        while self._min_dq and self._min_dq[-1][1] >= y_val:
+            self._min_dq.pop()
+        self._min_dq.append((seq, y_val))
+        while self._max_dq and self._max_dq[-1][1] <= y_val:
+            self._max_dq.pop()
+        self._max_dq.append((seq, y_val))
+
+        oldest = seq - MAX_POINTS + 1
+        for dq in (self._min_dq, self._max_dq):
+            while dq[0][0] < oldest:
+                dq.popleft()
+
+    def _ordered(self):
+        """Return the buffered samples oldest-first."""
+        n, h = self._count, self._head
+        if n < MAX_POINTS:
+            return self._xbuf[:n], self._ybuf[:n]
+
+        tail = MAX_POINTS - h
+        for buf, disp in ((self._xbuf, self._xdisp), (self._ybuf, self._ydisp)):
+            np.copyto(disp[:tail], buf[h:])
+            np.copyto(disp[tail:], buf[:h])
+        return self._xdisp, self._ydisp
+
+    def _clip_to_view(self, x_data, y_data):
+        """Drop the samples that have scrolled out of the x-window."""
+        # Samples left of the window only cost path transforms; keep one so
+        # the line still enters from the left edge.
+        xmin = self.ax.get_xlim()[0]
+        start = max(0, int(np.searchsorted(x_data, xmin)) - 1)
+        return x_data[start:], y_data[start:]
+
+    def _blit_line(self):
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        # Only the pixels under the old and the new line can differ
+        extent = self._line_bbox()
+        boxes = [b for b in (self._line_extent, extent) if b is not None]
+        self._line_extent = extent
+        if boxes:
+            self.canvas.blit(Bbox.union(boxes))
+
+    def _line_bbox(self):
+        """Pixel box around the line, padded by its width and clipped to the axes."""
+        pad = self.line.get_linewidth() * self.canvas.figure.dpi / 72
+        return Bbox.intersection(self.line.get_window_extent().padded(pad), self.ax.bbox)
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+        self._line_extent = self._line_bbox()
 
     def _on_close(self):
-        if self._after_id:
-            self.after_cancel(self._after_id)
+        _TICK_SUBSCRIBERS.remove(self._update_body)
+        from matplotlib.backend_bases import FigureCanvasBase
+
+        # Callbacks live on the figure, so detach ours before pooling it
+        fig = self.canvas.figure
+        self.canvas.mpl_disconnect(self._draw_cid)
+        # A bare canvas drops the figure's reference to this window, and the
+        # dpi is reset because the Tk canvas scaled it by the screen's pixel
+        # ratio and the next canvas would take that as the base dpi
+        FigureCanvasBase(fig)
+        fig.set_dpi(_FIG_DPI)
+        _FIG_POOL[self._pool_key] = fig
         self.destroy()
 
 # ─────────────────────── Main window ───────────────────────
+def _near_ratio(target, size, max_term=4):
+    """Zoom/subsample pair (p, q), both <= max_term, with size*p/q closest to target."""
+    pairs = ((p, q) for p in range(1, max_term + 1) for q in range(1, max_term + 1))
+    return min(pairs, key=lambda pq: abs(size * pq[0] / pq[1] - target))
+
 class MainApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -170,7 +422,14 @@ class MainApp(tk.Tk):
         self.geometry("880x520")
         self.configure(bg="#F5F5F5")
 
-        self.us = UniSimConnector()
+        # Set once the background connection attempt has finished
+        self.us = None
+        self._connection = queue.Queue(maxsize=1)
+
+        # One UniSim poll per tick, shared by every open plot window
+        self._latest = {"t": 0.0, "inlet": 0.0, "outlet": 0.0}
+        self._samples = queue.Queue(maxsize=1)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # ttk styling
         sty = ttk.Style(self)
@@ -185,6 +444,15 @@ class MainApp(tk.Tk):
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.bg_id = self.canvas.create_image(0, 0, anchor="nw")
         self.bg_img = None
+        # Decoded once, on the first resize, in the RGBA layout Tk photos use
+        self._has_bg = os.path.exists(IMAGE_PATH)
+        self._src_rgba = None
+        self._fallback_gray = None
+        self._last_wh = (0, 0)
+        self._hq_after = None
+        self._base_photo = None             # unscaled Tk photo for drag-time scaling
+        self._coarse_cache = OrderedDict()  # (zx, sx, zy, sy) -> scaled Tk photo, LRU order
+        self._photo_cache = OrderedDict()   # (w, h) -> LANCZOS PhotoImage, LRU order
         self.bind("<Configure>", self._layout)
 
         # Buttons
@@ -206,9 +474,72 @@ class MainApp(tk.Tk):
         self.id_outlet = self.canvas.create_window(0, 0, window=self.btn_outlet)
         self.id_start  = self.canvas.create_window(0, 0, window=self.btn_start)
         self.id_stop   = self.canvas.create_window(0, 0, window=self.btn_stop)
+        for it in (self.id_inlet, self.id_outlet, self.id_start, self.id_stop):
+            self.canvas.tag_raise(it)
+        self._btn_coords = {}
 
         self._layout()  # Initial placement
 
+        # Dispatch + SimulationCases.Open take seconds; run them off the Tk thread
+        for btn in (self.btn_inlet, self.btn_outlet, self.btn_start, self.btn_stop):
+            btn.state(["disabled"])
+        self._splash = ttk.Label(self.canvas, text="Connecting to UniSim …", padding=12)
+        self._splash.place(relx=0.5, rely=0.5, anchor="center")
+        threading.Thread(target=self._bg_connect, daemon=True).start()
+        self.after(100, self._await_connection)
+
+    # ---------- UniSim connection ----------
+    def _bg_connect(self):
+        us, streams, com_ready = None, None, False
+        try:
+            if pythoncom is not None:
+                pythoncom.CoInitialize()
+                com_ready = True
+            us = UniSimConnector()
+            if us.connected:
+                streams = us.detach()
+        except Exception as e:
+            print("UniSim connection failed:", e)
+        finally:
+            # Always hand a result back, or the splash would never go away
+            if streams is None:
+                us = UniSimConnector(connect=False)
+            self._connection.put((us, streams))
+            if com_ready:
+                pythoncom.CoUninitialize()
+
+    def _await_connection(self):
+        # Tk is not thread-safe, so the result is picked up from here
+        try:
+            us, streams = self._connection.get_nowait()
+        except queue.Empty:
+            self.after(100, self._await_connection)
+            return
+
+        if streams is not None:
+            try:
+                us.attach(streams)
+            except Exception as e:
+                print("UniSim connection failed:", e)
+                us.connected = False
+        self._connection_ready(us)
+
+    def _connection_ready(self, us):
+        self.us = us
+        self._splash.destroy()
+        for btn in (self.btn_inlet, self.btn_outlet, self.btn_start, self.btn_stop):
+            btn.state(["!disabled"])
+
+        if self.us.connected:
+            self.us.start_polling(UPDATE_MS, self._samples)
+            self.after(UPDATE_MS, self._poll_us)
+
+    def _on_close(self):
+        # The poller releases its proxies and uninitialises COM before we exit
+        if self.us is not None:
+            self.us.stop_polling()
+        self.destroy()
+
     # ---------- callbacks ----------
     def _start_sim(self):
         if self.us.connected:
@@ -223,43 +554,122 @@ class MainApp(tk.Tk):
             messagebox.showinfo("Demo", "UniSim not connected – demo only.")
 
     def _plot_inlet(self):
-        
-        t_get = self.us.sim_time
-        y_get = self.us.inlet_pressure
+        if not self.us.connected:
+            messagebox.showinfo("Demo", "UniSim not connected – demo only.")
+            return
+
+        t_get = lambda: self._latest["t"]
+        y_get = lambda: self._latest["inlet"]
 
         LivePlot("Inlet Pressure(kPa)", y_get, t_get)
 
     def _plot_outlet(self):
+        if not self.us.connected:
+            messagebox.showinfo("Demo", "UniSim not connected – demo only.")
+            return
 
-        t_get = self.us.sim_time
-        y_get = self.us.outlet_pressure
+        t_get = lambda: self._latest["t"]
+        y_get = lambda: self._latest["outlet"]
 
         LivePlot("Outlet Pressure (kPa)", y_get, t_get)
 
+    def _poll_us(self):
+        try:
+            sample = self._samples.get_nowait()
+        except queue.Empty:
+            sample = None
+        if isinstance(sample, Exception):
+            # The poller thread has stopped
+            messagebox.showerror("Data error", str(sample))
+            return
+
+        # Reschedule first so a failing plot window cannot stop the loop
+        self.after(UPDATE_MS, self._poll_us)
+        if sample is not None:
+            self._latest["t"], self._latest["inlet"], self._latest["outlet"] = sample
+            _tick()
+
     # ---------- layout ----------
     def _layout(self, event=None):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if w < 10 or h < 10:
             return
 
-        # Background
-        if os.path.exists(IMAGE_PATH):
-            img = Image.open(IMAGE_PATH).resize((w, h), Image.LANCZOS)
+        # Background: cached size, else Tk's integer zoom/subsample while the
+        # window is being dragged and one LANCZOS pass once it has settled
+        if (w, h) != self._last_wh:
+            self._last_wh = (w, h)
+            if self._hq_after:
+                self.after_cancel(self._hq_after)
+                self._hq_after = None
+
+            photo = self._photo_cache.get((w, h))
+            if photo is not None:
+                self._photo_cache.move_to_end((w, h))
+                self._show_bg(photo)
+            else:
+                # Preview only mid-drag; the first paint waits for the LANCZOS pass
+                if self._has_bg and self.bg_img is not None:
+                    self._show_bg(self._coarse_bg(w, h))
+                self._hq_after = self.after(150, lambda: self._do_resize(w, h))
+
+        # Buttons (only touch items whose position actually moved)
+        for it, pos in ((self.id_inlet,  (0.15*w, 0.25*h)),
+                        (self.id_outlet, (0.75*w, 0.65*h)),
+                        (self.id_start,  (0.05*w, 0.90*h)),
+                        (self.id_stop,   (0.20*w, 0.90*h))):
+            if pos == self._btn_coords.get(it):
+                continue
+            self.canvas.coords(it, *pos)
+            self._btn_coords[it] = pos
+
+    def _coarse_bg(self, w, h):
+        if self._base_photo is None:
+            self._base_photo = tk.PhotoImage(master=self, file=IMAGE_PATH)
+        base = self._base_photo
+        # Stretched to about (w, h) like the final image, so settling keeps the framing
+        zx, sx = _near_ratio(w, base.width())
+        zy, sy = _near_ratio(h, base.height())
+
+        key = (zx, sx, zy, sy)
+        photo = self._coarse_cache.get(key)
+        if photo is not None:
+            self._coarse_cache.move_to_end(key)
+        else:
+            # Subsample first so no intermediate is larger than the source
+            photo = base.subsample(sx, sy).zoom(zx, zy)
+            self._coarse_cache[key] = photo
+            if len(self._coarse_cache) > BG_CACHE_SIZE:
+                self._coarse_cache.popitem(last=False)
+        return photo
+
+    def _do_resize(self, w, h):
+        # PIL is imported here, after the window is up, not at start-up
+        from PIL import Image, ImageTk
+
+        self._hq_after = None
+        self._coarse_cache.clear()
+        if self._has_bg:
+            if self._src_rgba is None:
+                self._src_rgba = Image.open(IMAGE_PATH).convert("RGBA")
+            img = self._src_rgba.resize((w, h), Image.Resampling.LANCZOS,
+                                        reducing_gap=3.0)
         else:
-            img = Image.new("RGB", (w, h), "#D0D0D0")
-        self.bg_img = ImageTk.PhotoImage(img)
+            if self._fallback_gray is None or self._fallback_gray.size != (w, h):
+                self._fallback_gray = Image.new("RGBA", (w, h), "#D0D0D0")
+            img = self._fallback_gray
+        photo = ImageTk.PhotoImage(img)
+
+        self._photo_cache[(w, h)] = photo
+        if len(self._photo_cache) > BG_CACHE_SIZE:
+            self._photo_cache.popitem(last=False)
+        self._show_bg(photo)
+
+    def _show_bg(self, photo):
+        self.bg_img = photo
         self.canvas.itemconfig(self.bg_id, image=self.bg_img)
         self.canvas.tag_lower(self.bg_id)
 
-        # Buttons
-        self.canvas.coords(self.id_inlet,  0.15*w, 0.25*h)
-        self.canvas.coords(self.id_outlet, 0.75*w, 0.65*h)
-        self.canvas.coords(self.id_start,  0.05*w, 0.90*h)
-        self.canvas.coords(self.id_stop,   0.20*w, 0.90*h)
-
-        for it in (self.id_inlet, self.id_outlet, self.id_start, self.id_stop):
-            self.canvas.tag_raise(it)
-
 # ──────────────────────────── main ────────────────────────────
 if __name__ == "__main__":
     if sys.platform != "win32":